@@ -1 +1,17 @@
-from .print import LogLevel, PrinterOnSteroids, logger, namespace_print_on_steroids, print_on_steroids, graceful_exceptions
+from typing import TYPE_CHECKING
+
+from .print import LogLevel, PrinterOnSteroids, namespace_print_on_steroids, print_on_steroids, graceful_exceptions
+
+__all__ = ["LogLevel", "PrinterOnSteroids", "logger", "namespace_print_on_steroids", "print_on_steroids", "graceful_exceptions"]
+
+if TYPE_CHECKING:
+    logger: PrinterOnSteroids
+
+
+def __getattr__(name: str):
+    # `logger` is created lazily on first access, see `print.__getattr__`
+    if name == "logger":
+        from .print import logger
+
+        return globals().setdefault("logger", logger)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,23 @@
+import atexit
 import os
 import re
 import sys
+import threading
 import time
 from contextlib import contextmanager
-from pathlib import Path
-from types import FrameType
+from functools import lru_cache
+from queue import SimpleQueue
+from types import CodeType, FrameType
 from typing import IO, Any, Callable, Iterable, Literal, Optional
+from weakref import WeakKeyDictionary, proxy
 
 from rich import get_console
 from rich.console import Console
 from rich.markup import escape as escape_markup
+from rich.text import Text
 from tqdm import tqdm as TQDMClass
 
+# On CPython this is `sys._getframe` itself (not a wrapper), so using it on the hot path costs no extra Python frame
 from .get_frame import get_frame
 
 # If we cannot import better_exceptions, we fall back to the standard traceback module
@@ -20,6 +26,22 @@ try:
 except ImportError:
     from traceback import format_exception
 
+# Last rendered timestamp fragment as `(epoch_second, (text, style))`, reused for calls within the same second.
+# The tuple is replaced as a whole, so concurrent threads never see a second paired with another second's string.
+_TS_CACHE = (0, ("", ""))
+# NOTE: `datetime.fromtimestamp(...).isoformat(sep=" ", timespec="seconds")` and hand-rolled f-string / %-formatting of
+# `time.localtime()` all benchmarked slower than strftime for this
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _cached_timestamp() -> tuple[str, str]:
+    global _TS_CACHE
+    now = int(time.time())
+    cached = _TS_CACHE
+    if now != cached[0]:
+        cached = _TS_CACHE = (now, (f"{time.strftime(_TIME_FORMAT, time.localtime(now))} |", "dim cyan"))
+    return cached[1]
+
 
 class LogLevel:
     # For color options, see https://rich.readthedocs.io/en/stable/appendix/colors.html
@@ -48,6 +70,7 @@ class LogLevel:
         "error": 4,
     }
 
+    # Kept for backwards compatibility, the hot paths use the module-level `_COLOR`, `_REPR` and `_INT` aliases below
     @staticmethod
     def get_color(key):
         return LogLevel.color_map[key]
@@ -61,6 +84,80 @@ class LogLevel:
         return LogLevel.int_map[key]
 
 
+# Module-level aliases to skip the attribute and staticmethod lookups on the hot path
+_COLOR = LogLevel.color_map
+_REPR = LogLevel.repr_map
+_INT = LogLevel.int_map
+# (color, repr, int) per level so the hot path needs a single lookup
+_LEVELS = {key: (_COLOR[key], _REPR[key], _INT[key]) for key in _COLOR}
+# Levels can be given by name or by their int, this normalizes both to the name with a single lookup
+_LEVEL_NAMES = {**{key: key for key in _INT}, **{value: key for key, value in _INT.items()}}
+# The level prefix only depends on the level, so we render it once at import time
+_LEVEL_INFO = {key: Text.from_markup(f"[b {color}]{name:<7}[/] [dim cyan]|[/]") for key, (color, name, _) in _LEVELS.items()}
+
+
+@lru_cache(maxsize=64)
+def _rank_info(rank: int, level: str) -> Text:
+    return Text.from_markup(f"[b {_COLOR[level]}]Rank {rank}[/] [dim cyan]|[/]")
+
+
+@lru_cache(maxsize=64)
+def _namespace_info(namespace: str, level: str) -> Text:
+    level_color, level_name, _ = _LEVELS[level]
+    return Text.from_markup(f"[b {level_color}]{namespace} [dim cyan]-[/] {level_name}[dim cyan]:[/]")
+
+
+def _message_text(values: tuple, sep: str, escape: bool) -> Text:
+    if len(values) == 1:
+        message = values[0]
+        if type(message) is not str:
+            message = str(message)
+    else:
+        message = sep.join(map(str, values))
+    # Plain text without emoji codes (`:smile:`) needs neither escaping nor rich's markup parser
+    if escape and ":" not in message:
+        return Text(message)
+    # Skip the regex for the common case of plain text, only `[` and a trailing backslash are ever escaped
+    if escape and ("[" in message or message.endswith("\\")):
+        message = escape_markup(message)
+    return Text.from_markup(message)
+
+
+_DEFAULT_CONSOLE: Optional[Console] = None
+
+
+def _get_default_console() -> Console:
+    # rich's global console is only ever reconfigured in place, so holding on to it is safe
+    global _DEFAULT_CONSOLE
+    console = _DEFAULT_CONSOLE
+    if console is None:
+        console = _DEFAULT_CONSOLE = get_console()
+    return console
+
+
+def reset_console():
+    """Drop the cached default console so that the next print picks up rich's current global console."""
+    global _DEFAULT_CONSOLE
+    _DEFAULT_CONSOLE = None
+
+
+# Weak keys, so that caching a console does not keep closed files or `StringIO` buffers alive
+_FILE_CONSOLES: "WeakKeyDictionary[IO[str], Console]" = WeakKeyDictionary()
+
+
+def _console_for(file: IO[str]) -> Console:
+    # File objects hash by identity, so repeated prints to the same file reuse one console
+    try:
+        console = _FILE_CONSOLES.get(file)
+        if console is None:
+            # The console only gets a proxy, a strong reference from the value would keep the weak key alive forever
+            console = _FILE_CONSOLES[file] = Console(file=proxy(file))
+        return console
+    except TypeError:
+        # File-likes that cannot be hashed or weakly referenced just get a fresh console every time
+        return Console(file=file)
+
+
 def rich_print(
     *objects: Any,
     sep: str = " ",
@@ -86,33 +183,217 @@ def rich_print(
         flush (bool, optional): Has no effect as Rich always flushes output. Defaults to False.
     """
 
-    write_console = get_console() if file is None else Console(file=file)
+    write_console = _get_default_console() if file is None else _console_for(file)
+
+    # Fast path: without any live tqdm bars there is nothing to clear and redraw, so skip the lock and context manager
+    if not TQDMClass._instances:
+        return write_console.print(*objects, sep=sep, end=end, highlight=False)
 
     # Do not break tqdm bars, when using tqdm.rich it works out of the box since it uses the same console
-    # (Almost) a no-op if not using tqdm
     # NOTE: debate nolock=True vs nolock=False. Let's stay with the default from reference implementation for now (nolock=False).
     with TQDMClass.external_write_mode(file=sys.stdout, nolock=False):
         return write_console.print(*objects, sep=sep, end=end, highlight=False)
 
 
-def extract_frame_info(frame: FrameType):
-    line_no = frame.f_lineno
-    function_name = frame.f_code.co_name
-    file_name = frame.f_code.co_filename
-    path = frame.f_globals["__name__"]
+def _plain_output_possible(console: Console) -> bool:
+    # Without a terminal rich drops all styles anyway, unless it renders to Jupyter, records or is muted
+    return not (console.is_terminal or console.is_jupyter or console.record or console.quiet)
+
+
+def _plain_write(output: str) -> None:
+    file = _get_default_console().file
+    if not TQDMClass._instances:
+        file.write(output)
+        return file.flush()
+
+    with TQDMClass.external_write_mode(file=sys.stdout, nolock=False):
+        file.write(output)
+        file.flush()
+
+
+def _plain_print(text: Text, end: str = "\n") -> None:
+    """
+    Writes the plain text of an already assembled log line to the file of rich's default console, skipping rich's
+    render pipeline. Only used if `_plain_output_possible`. Unlike `rich_print`, long lines are not wrapped.
+    """
+    _plain_write(text.plain + end)
+
+
+def _default_print(text: Text, end: str = "\n") -> None:
+    # Checked on every write (cheap compared to rendering), so that e.g. a later `rich.reconfigure(...)` is respected
+    if _plain_output_possible(_get_default_console()):
+        return _plain_print(text, end=end)
+    return rich_print(text, end=end)
+
+
+class _AsyncWriter:
+    """
+    Prints messages from a daemon thread so that the caller only pays for an enqueue.
+
+    Messages are printed in the order they were enqueued. Messages that pile up while printing are joined and printed with a
+    single `Console.print` call, or a single plain write if `_plain_output_possible`. Call `flush()` to block until all
+    pending messages are printed.
+    """
+
+    max_batch_size = 256
+
+    def __init__(self):
+        self._reset()
+        atexit.register(self.flush)
+        if hasattr(os, "register_at_fork"):
+            # Threads do not survive a fork, the child gets a fresh queue and starts its own thread on the next message
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        self.queue = SimpleQueue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._drain, name="print-on-steroids", daemon=True)
+                self.thread.start()
+
+    def __call__(self, message: Text, end: str = "\n"):
+        if self.thread is None:
+            self.start()
+        self.queue.put((message, end))
+
+    def flush(self):
+        thread = self.thread
+        if thread is None or threading.current_thread() is thread:
+            return
+        done = threading.Event()
+        self.queue.put(done)
+        # Never wait on a thread that is not around anymore to set the event
+        while not done.wait(0.1):
+            if not thread.is_alive():
+                return
+
+    def _drain(self):
+        while True:
+            batch = [self.queue.get()]
+            # Collect everything that is already pending (up to a limit to keep latency low) into a single print
+            while len(batch) < self.max_batch_size and not self.queue.empty():
+                batch.append(self.queue.get())
+
+            pending = []
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    # Flush requested: everything enqueued before the event needs to be printed first
+                    self._print_batch(pending)
+                    pending = []
+                    item.set()
+                else:
+                    pending.append(item)
+            self._print_batch(pending)
+
+    def _print_batch(self, batch: list[tuple[Text, str]]):
+        if not batch:
+            return
+        plain = _plain_output_possible(_get_default_console())
+        try:
+            if plain:
+                _plain_write("".join(message.plain + end for message, end in batch))
+            else:
+                # Separate objects so that markup of one message cannot bleed into the next
+                rich_print(*(message + end for message, end in batch), sep="", end="")
+        except Exception:
+            # A single bad message (e.g. invalid markup) should not swallow the whole batch
+            for message, end in batch:
+                try:
+                    if plain:
+                        _plain_print(message, end=end)
+                    else:
+                        rich_print(message, end=end)
+                except Exception as e:
+                    # Keep the thread alive, otherwise all following messages (and flushes) would hang
+                    sys.stderr.write(f"print-on-steroids: failed to print message: {e!r}\n")
+
+
+# Created on first use of `async_io=True`, so that importing does not register `atexit` and fork hooks for everyone
+_ASYNC_WRITER: Optional[_AsyncWriter] = None
+_ASYNC_WRITER_LOCK = threading.Lock()
+
+
+def _get_async_writer() -> _AsyncWriter:
+    global _ASYNC_WRITER
+    with _ASYNC_WRITER_LOCK:
+        if _ASYNC_WRITER is None:
+            _ASYNC_WRITER = _AsyncWriter()
+        return _ASYNC_WRITER
+
+
+def _flush_async_writer() -> None:
+    writer = _ASYNC_WRITER
+    if writer is not None:
+        writer.flush()
 
-    if path == "__main__":
-        path = Path(file_name).name
-    else:
-        # Enable jumping to source code in IDEs
-        path = f"{path.replace('.', '/')}.py"
 
-    return line_no, function_name, file_name, path
+@lru_cache(maxsize=512)
+def _module_to_path(module_name: str, file_name: str) -> str:
+    if module_name == "__main__":
+        return os.path.basename(file_name)
+    # Enable jumping to source code in IDEs
+    return f"{module_name.replace('.', '/')}.py"
+
+
+# Everything but the line number is constant per function, so we only compute it once per call site, see `_frame_key`.
+# Re-executed notebook cells or `exec`'d code add new keys, so the cache is cleared once it is full.
+_FRAME_INFO_CACHE: dict[tuple[str, int, str], tuple[str, str, str]] = {}
+_FRAME_INFO_CACHE_SIZE = 1024
+
+
+def _frame_key(code: CodeType) -> tuple[str, int, str]:
+    # Not the code object itself, since code objects compare equal across files and would be kept alive
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+def extract_frame_info(frame: FrameType):
+    code = frame.f_code
+    key = _frame_key(code)
+    cached = _FRAME_INFO_CACHE.get(key)
+    if cached is None:
+        file_name = code.co_filename
+        path = _module_to_path(frame.f_globals["__name__"], file_name)
+        if len(_FRAME_INFO_CACHE) >= _FRAME_INFO_CACHE_SIZE:
+            _FRAME_INFO_CACHE.clear()
+        cached = _FRAME_INFO_CACHE[key] = (code.co_name, file_name, path)
+
+    return frame.f_lineno, *cached
+
+
+def _info_parts(
+    level: str, rank: Optional[int], rank0_only: bool, print_time: bool, print_level: bool, frame: Optional[FrameType]
+) -> list:
+    """
+    Info prefix fragments for `Text.assemble`, each followed by a space. The origin is only included if a `frame` is given.
+
+    Fragments are assembled as styled `Text` so that rich does not need to parse markup on every call.
+    """
+    parts = []
+    if print_time:
+        parts += (_cached_timestamp(), " ")
+    if print_level:
+        parts += (_LEVEL_INFO[level], " ")
+    if frame is not None:
+        # Inline cache hit to save a function call, `extract_frame_info` fills the cache on a miss
+        cached = _FRAME_INFO_CACHE.get(_frame_key(frame.f_code))
+        if cached is None:
+            line_no, function_name, _, path = extract_frame_info(frame)
+        else:
+            line_no = frame.f_lineno
+            function_name, _, path = cached
+        parts += ((path, "cyan"), ":", (str(line_no), "cyan"), " - ", (function_name, "dim cyan"), " ", ("|", "dim cyan"), " ")
+    if rank is not None and not rank0_only:
+        parts += (_rank_info(rank, level), " ")
+    return parts
 
 
 def print_on_steroids(
     *values,
-    level: str = "print",
+    level: str | int = "print",
     rank: int = None,
     rank0_only: bool = None,
     print_time: bool = False,
@@ -122,35 +403,21 @@ def print_on_steroids(
     end: str = "\n",
     escape: bool = True,
     stack_offset: int = 1,
+    writer: Callable[..., Any] = rich_print,
 ):
     if rank0_only and rank != 0:
         return
+    level = _LEVEL_NAMES[level]
     if level == "print":
         print_level = False
 
-    frame = get_frame(stack_offset)
-    line_no, function_name, file_name, path = extract_frame_info(frame)
-
-    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-    level_color = LogLevel.get_color(level)
-    level_name = LogLevel.get_repr(level)
-
-    timestamp_info = f"[dim cyan]{timestamp} |[/] " if print_time else ""
-    level_info = f"[b {level_color}]{level_name:<7}[/] [dim cyan]|[/] " if print_level else ""
-    origin_info = f"[cyan]{path}[/]:[cyan]{line_no}[/] - [dim cyan]{function_name}[/] [dim cyan]|[/] " if print_origin else ""
-    rank_info = f"[b {level_color}]Rank {rank}[/] [dim cyan]|[/]" if rank is not None and not rank0_only else ""
-
-    info = timestamp_info + level_info + origin_info + rank_info
-    info = info.strip()
+    message = _message_text(values, sep, escape)
+    # Walking the stack is comparatively expensive, only do it if we actually print the origin
+    parts = _info_parts(level, rank, rank0_only, print_time, print_level, get_frame(stack_offset) if print_origin else None)
+    if parts:
+        message = Text.assemble(*parts, message)
 
-    message = sep.join(str(value) for value in values)
-    if escape:
-        message = escape_markup(message)
-
-    if len(info) > 0:
-        message = f"{info} {message}"
-
-    rich_print(message, end=end)
+    writer(message, end=end)
 
 
 def namespace_print_on_steroids(
@@ -162,17 +429,96 @@ def namespace_print_on_steroids(
     sep=" ",
     end="\n",
     escape=True,
+    writer: Callable[..., Any] = rich_print,
 ):
     if rank0_only and rank != 0:
         return
-    level_color = LogLevel.get_color(level)
-    level_name = LogLevel.get_repr(level)
-    info = f"[b {level_color}]{namespace} [dim cyan]-[/] {level_name}[dim cyan]:[/]"
-    message = sep.join(str(value) for value in values)
-    if escape:
-        message = escape_markup(message)
+    info = _namespace_info(namespace, _LEVEL_NAMES[level])
+    message = _message_text(values, sep, escape)
 
-    rich_print(info, message, end=end)
+    # Only the prefix is styled, the message is printed as is
+    writer(Text.assemble(info, " ", message), end=end)
+
+
+def _noop(*values, **kwargs):
+    pass
+
+
+def _make_level_method(level: str, print_time: bool = True, print_level: bool = True, print_origin: bool = True):
+    """
+    Builds `PrinterOnSteroids.<level>`. The level is filtered and dispatched right here instead of going through
+    `PrinterOnSteroids.log`, which saves a function call and kwargs forwarding on every log. Subclasses that override
+    `log` still get every call routed through their `log`.
+    """
+    level_int = _INT[level]
+    print_in_package_mode = level_int > _INT["debug"]
+
+    def level_method(
+        self,
+        *values,
+        rank: int = None,
+        rank0_only: bool = None,
+        sep=" ",
+        end="\n",
+        escape=None,
+        print_time=print_time,
+        print_level=print_level,
+        print_origin=print_origin,
+    ):
+        if type(self).log is not PrinterOnSteroids.log:
+            return self.log(
+                *values,
+                level=level,
+                rank=rank,
+                rank0_only=rank0_only,
+                sep=sep,
+                end=end,
+                escape=escape,
+                stack_offset=3,
+                print_time=print_time,
+                print_level=print_level,
+                print_origin=print_origin,
+            )
+        if self.mode == "silent" or level_int < self._verb_int:
+            return
+        if rank is None:
+            rank = self.rank
+        if rank0_only is None:
+            rank0_only = self.print_rank0_only
+        # Suppressed on this rank, bail out before any formatting or frame lookup happens further down
+        if rank0_only and rank != 0:
+            return
+
+        if self.mode == "dev":
+            print_on_steroids(
+                *values,
+                level=level,
+                rank=rank,
+                rank0_only=rank0_only,
+                sep=sep,
+                end=end,
+                escape=escape,
+                stack_offset=2,
+                print_time=print_time,
+                print_level=print_level,
+                print_origin=print_origin,
+                writer=self._writer,
+            )
+        elif self.mode == "package" and print_in_package_mode:
+            namespace_print_on_steroids(
+                *values,
+                namespace=self.package_name,
+                level=level,
+                rank=rank,
+                rank0_only=rank0_only,
+                sep=sep,
+                end=end,
+                writer=self._writer,
+            )
+
+    level_method.__name__ = level
+    level_method.__qualname__ = f"PrinterOnSteroids.{level}"
+    return level_method
 
 
 class PrinterOnSteroids:
@@ -184,16 +530,94 @@ class PrinterOnSteroids:
         rank: int = None,
         print_rank0_only=False,
         escape=True,
+        async_io=False,
     ):
         if mode == "from_env":
             assert package_name is not None
             mode = os.getenv(f"{package_name.upper()}_LOG_MODE", "package")
-        self.mode = mode
+        self._mode = mode
         self.package_name = package_name
         self.rank = rank
         self.print_rank0_only = print_rank0_only
-        self.verbosity = verbosity
+        self._verbosity = verbosity
+        self._verb_int = _INT[verbosity] if verbosity else _INT["print"]
         self.escape = escape
+        self.async_io = async_io
+        self._update_writer()
+        self._update_level_methods()
+
+    # `mode` and `verbosity` are properties so that assigning them directly also refreshes the cached filtering state
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode: Literal["dev", "package", "silent"]):
+        self._mode = mode
+        self._update_level_methods()
+
+    @property
+    def verbosity(self) -> str:
+        return self._verbosity
+
+    @verbosity.setter
+    def verbosity(self, verbosity: str):
+        self._verbosity = verbosity
+        self._verb_int = _INT[verbosity] if verbosity else _INT["print"]
+        self._update_level_methods()
+
+    def _update_level_methods(self):
+        # Levels that are filtered anyway are shadowed by a no-op on the instance, so suppressed calls are nearly free.
+        # Not for subclasses that override `log`, which get to see every call.
+        shadow = type(self).log is PrinterOnSteroids.log
+        for level in ("print", "debug", "info", "success", "warning", "error"):
+            level_int = _INT[level]
+            filtered = (
+                self.mode == "silent" or level_int < self._verb_int or (self.mode == "package" and level_int <= _INT["debug"])
+            )
+            current = self.__dict__.get(level, _noop)
+            if current is not _noop:
+                # Never touch instance attributes set by the user, e.g. `logger.info = custom` or `mock.patch.object`
+                continue
+            if shadow and filtered:
+                setattr(self, level, _noop)
+            else:
+                self.__dict__.pop(level, None)
+
+    def _update_writer(self):
+        if self.async_io:
+            # Also writes plain text if possible, but batches lines into a single write
+            writer = _get_async_writer()
+            writer.start()
+            self._writer = writer
+        else:
+            # Writes plain text if possible, e.g. for CI logs or output piped to a file, which is much cheaper than rich
+            self._writer = _default_print
+
+    def flush(self):
+        """Block until all messages queued with `async_io=True` have been printed."""
+        _flush_async_writer()
+
+    def _resolve_log_args(self, level: str | int, rank: Optional[int], rank0_only: Optional[bool], escape: Optional[bool]):
+        """
+        Shared prelude of `log` and `log_many` (inlined in the level methods for speed). Returns `None` if the message is
+        filtered, otherwise the normalized `(level, rank, rank0_only)`.
+        """
+        if self.mode == "silent":
+            return None
+        level = _LEVEL_NAMES[level]
+        if _INT[level] < self._verb_int:
+            return None
+        if rank is None:
+            rank = self.rank
+        if rank0_only is None:
+            rank0_only = self.print_rank0_only
+        # Suppressed on this rank, bail out before any formatting or frame lookup happens further down
+        if rank0_only and rank != 0:
+            return None
+        if self.escape is None:
+            self.escape = escape
+        return level, rank, rank0_only
 
     def log(
         self,
@@ -209,16 +633,10 @@ class PrinterOnSteroids:
         print_level=True,
         print_origin=True,
     ):
-        if self.mode == "silent":
+        resolved = self._resolve_log_args(level, rank, rank0_only, escape)
+        if resolved is None:
             return
-        if self.verbosity and LogLevel.get_int(level) < LogLevel.get_int(self.verbosity):
-            return
-        if rank is None:
-            rank = self.rank
-        if rank0_only is None:
-            rank0_only = self.print_rank0_only
-        if self.escape is None:
-            self.escape = escape
+        level, rank, rank0_only = resolved
 
         if self.mode == "dev":
             print_on_steroids(
@@ -233,168 +651,67 @@ class PrinterOnSteroids:
                 print_time=print_time,
                 print_level=print_level,
                 print_origin=print_origin,
+                writer=self._writer,
             )
         elif self.mode == "package":
-            if LogLevel.get_int(level) > LogLevel.get_int("debug"):
+            if _INT[level] > _INT["debug"]:
                 namespace_print_on_steroids(
-                    *values, namespace=self.package_name, level=level, rank=rank, rank0_only=rank0_only, sep=sep, end=end
+                    *values,
+                    namespace=self.package_name,
+                    level=level,
+                    rank=rank,
+                    rank0_only=rank0_only,
+                    sep=sep,
+                    end=end,
+                    writer=self._writer,
                 )
 
-    def print(
-        self,
-        *values,
-        rank: int = None,
-        rank0_only: bool = None,
-        sep=" ",
-        end="\n",
-        escape=None,
-        print_time=False,
-        print_level=False,
-        print_origin=False,
-    ):
-        self.log(
-            *values,
-            level="print",
-            rank=rank,
-            rank0_only=rank0_only,
-            sep=sep,
-            end=end,
-            escape=escape,
-            stack_offset=3,
-            print_time=print_time,
-            print_level=print_level,
-            print_origin=print_origin,
-        )
-
-    def debug(
-        self,
-        *values,
-        rank: int = None,
-        rank0_only: bool = None,
-        sep=" ",
-        end="\n",
-        escape=None,
-        print_time=True,
-        print_level=False,
-        print_origin=True,
-    ):
-        self.log(
-            *values,
-            level="debug",
-            rank=rank,
-            rank0_only=rank0_only,
-            sep=sep,
-            end=end,
-            escape=escape,
-            stack_offset=3,
-            print_time=print_time,
-            print_level=print_level,
-            print_origin=print_origin,
-        )
-
-    def info(
-        self,
-        *values,
-        rank: int = None,
-        rank0_only: bool = None,
-        sep=" ",
-        end="\n",
-        escape=None,
-        print_time=True,
-        print_level=True,
-        print_origin=True,
-    ):
-        self.log(
-            *values,
-            level="info",
-            rank=rank,
-            rank0_only=rank0_only,
-            sep=sep,
-            end=end,
-            escape=escape,
-            stack_offset=3,
-            print_time=print_time,
-            print_level=print_level,
-            print_origin=print_origin,
-        )
-
-    def success(
-        self,
-        *values,
-        rank: int = None,
-        rank0_only: bool = None,
-        sep=" ",
-        end="\n",
-        escape=None,
-        print_time=True,
-        print_level=True,
-        print_origin=True,
-    ):
-        self.log(
-            *values,
-            level="success",
-            rank=rank,
-            rank0_only=rank0_only,
-            sep=sep,
-            end=end,
-            escape=escape,
-            stack_offset=3,
-            print_time=print_time,
-            print_level=print_level,
-            print_origin=print_origin,
-        )
-
-    def warning(
+    def log_many(
         self,
-        *values,
+        messages: Iterable[Any],
+        level: str | int = "info",
         rank: int = None,
         rank0_only: bool = None,
-        sep=" ",
-        end="\n",
         escape=None,
+        stack_offset=1,
         print_time=True,
         print_level=True,
         print_origin=True,
     ):
-        self.log(
-            *values,
-            level="warning",
-            rank=rank,
-            rank0_only=rank0_only,
-            sep=sep,
-            end=end,
-            escape=escape,
-            stack_offset=3,
-            print_time=print_time,
-            print_level=print_level,
-            print_origin=print_origin,
-        )
-
-    def error(
-        self,
-        *values,
-        rank: int = None,
-        rank0_only: bool = None,
-        sep=" ",
-        end="\n",
-        escape=None,
-        print_time=True,
-        print_level=True,
-        print_origin=True,
-    ):
-        self.log(
-            *values,
-            level="error",
-            rank=rank,
-            rank0_only=rank0_only,
-            sep=sep,
-            end=end,
-            escape=escape,
-            stack_offset=3,
-            print_time=print_time,
-            print_level=print_level,
-            print_origin=print_origin,
-        )
+        """
+        Log each of `messages` on its own line, e.g. a bunch of metrics at once.
+
+        The timestamp and origin are computed once for all lines (the origin is the caller of `log_many`) and all lines
+        are printed at once, which is much cheaper than calling `log` for each message.
+        """
+        resolved = self._resolve_log_args(level, rank, rank0_only, escape)
+        if resolved is None:
+            return
+        level, rank, rank0_only = resolved
+
+        if self.mode == "dev":
+            if level == "print":
+                print_level = False
+            frame = get_frame(stack_offset) if print_origin else None
+            prefix = Text.assemble(*_info_parts(level, rank, rank0_only, print_time, print_level, frame))
+        elif self.mode == "package" and _INT[level] > _INT["debug"]:
+            prefix = Text.assemble(_namespace_info(self.package_name, level), " ")
+            # Like `log`, which relies on the `escape=True` default of `namespace_print_on_steroids` in package mode
+            if escape is None:
+                escape = True
+        else:
+            return
+
+        lines = [Text.assemble(prefix, _message_text((message,), " ", escape)) for message in messages]
+        if lines:
+            self._writer(Text("\n").join(lines))
+
+    print = _make_level_method("print", print_time=False, print_level=False, print_origin=False)
+    debug = _make_level_method("debug", print_level=False)
+    info = _make_level_method("info")
+    success = _make_level_method("success")
+    warning = _make_level_method("warning")
+    error = _make_level_method("error")
 
     def config(
         self,
@@ -404,13 +721,25 @@ class PrinterOnSteroids:
         rank: int = None,
         print_rank0_only: bool = None,
         escape: bool = None,
+        async_io: bool = None,
     ):
-        self.rank = self.rank if rank is None else rank
-        self.mode = self.mode if mode is None else mode
-        self.package_name = self.package_name if package_name is None else package_name
-        self.print_rank0_only = self.print_rank0_only if print_rank0_only is None else print_rank0_only
-        self.verbosity = self.verbosity if verbosity is None else verbosity
-        self.escape = self.escape if escape is None else escape
+        # Explicit `is not None` checks, so that falsy values like `rank=0` are applied and derived state is only
+        # recomputed when its input actually changed
+        if rank is not None:
+            self.rank = rank
+        if mode is not None:
+            self.mode = mode
+        if package_name is not None:
+            self.package_name = package_name
+        if print_rank0_only is not None:
+            self.print_rank0_only = print_rank0_only
+        if verbosity is not None:
+            self.verbosity = verbosity
+        if escape is not None:
+            self.escape = escape
+        if async_io is not None:
+            self.async_io = async_io
+            self._update_writer()
 
     def set_rank(self, rank: int):
         self.rank = rank
@@ -461,12 +790,14 @@ def graceful_exceptions(
         my_func(1, 2)
     ```
     """
-    handled_exceptions = handled_exceptions if isinstance(handled_exceptions, Iterable) else [handled_exceptions]
     try:
         yield
     except Exception as e:
-        if not any(issubclass(e.__class__, exc) for exc in handled_exceptions):
-            raise e
+        # Normalize only once an exception actually occurred, so the success path stays free of any overhead
+        if not isinstance(handled_exceptions, type):
+            handled_exceptions = tuple(handled_exceptions)
+        if not isinstance(e, handled_exceptions):
+            raise
 
         traceback, full_traceback = e.__traceback__, e.__traceback__
         # Loop until last frame, which is where the exception was raised
@@ -491,13 +822,17 @@ def graceful_exceptions(
             pattern = r'File "([^"]+)", line (\d+), in ([^ ]+)'
             exc_message = re.sub(pattern, make_filepaths_relative, exc_message)
 
+        # Print pending async log messages first so that they appear before the traceback
+        _flush_async_writer()
+
         color = "red" if exit else "green"
         prefix = "Caught " if not exit else ""
         if len(extra_message):
             extra_message = f"| {extra_message} "
-        get_console().rule(title=f"[b]↓[/] {prefix}{formatted_exception} | {origin_info } {extra_message}[b]↓", style=color)
+        console = _get_default_console()
+        console.rule(title=f"[b]↓[/] {prefix}{formatted_exception} | {origin_info } {extra_message}[b]↓", style=color)
         rich_print(exc_message.strip())
-        get_console().rule(title=f"[b]↑[/] {prefix}{formatted_exception} | {origin_info } {extra_message}[b]↑", style=color)
+        console.rule(title=f"[b]↑[/] {prefix}{formatted_exception} | {origin_info } {extra_message}[b]↑", style=color)
 
         # Optional user-defined callback
         on_exception(e)
@@ -507,5 +842,12 @@ def graceful_exceptions(
             sys.exit(1)
 
 
-# Instantiate for easy import
-logger = PrinterOnSteroids(mode="dev", package_name=None)
+# Annotation only (no binding), so that static tools know the type while `__getattr__` below still creates it lazily
+logger: PrinterOnSteroids
+
+
+def __getattr__(name: str):
+    # Instantiate for easy import, lazily on first access (PEP 562) so importing e.g. only `graceful_exceptions` stays cheap
+    if name == "logger":
+        return globals().setdefault("logger", PrinterOnSteroids(mode="dev", package_name=None))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")